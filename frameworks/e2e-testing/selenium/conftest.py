@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the Selenium examples
+"""
+
+
+def pytest_addoption(parser):
+    """Register command line options for the Selenium tests"""
+    parser.addoption(
+        "--visual",
+        action="store_true",
+        default=False,
+        help="Load images and fonts for tests that check layout",
+    )
@@ -3,22 +3,89 @@ Login Test with Selenium WebDriver
 
 This script demonstrates how to implement login tests using Selenium WebDriver
 with the Page Object Model pattern in Python.
+
+The tests are written in pytest style so that pytest-xdist can distribute them
+across worker processes, each of which owns its own Chrome instance. Test
+durations vary widely, so idle workers steal queued tests from busy ones:
+
+    pip install -r requirements.txt
+    pytest -n auto --dist=worksteal frameworks/e2e-testing/selenium/
+
+These options are the defaults in the accompanying pytest.ini.
+
+To run the browsers on a Selenium Grid instead of the local machine, start
+the Grid from docker-compose.yml and point SELENIUM_HUB at it:
+
+    docker compose up -d --scale chrome=4
+    SELENIUM_HUB=http://localhost:4444/wd/hub pytest frameworks/e2e-testing/selenium/
 """
-import unittest
+import functools
 import json
 import os
+import pytest
+import requests
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
-class LoginPage:
-    """Page Object representing the login page"""
+def refresh_stale_elements(method):
+    """Re-run a page action with fresh lookups if a cached element went stale"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException:
+            self._cache.clear()
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
+class BasePage:
+    """Common behaviour shared by all Page Objects"""
+    
     def __init__(self, driver):
         self.driver = driver
+        self.wait = WebDriverWait(self.driver, 5, poll_frequency=0.25)
+        self._cache = {}
+        
+    def _el(self, locator, condition=EC.element_to_be_clickable):
+        """Find an element, reusing the reference until the page changes"""
+        # Key on the condition too, so an element found by a weaker wait
+        # (e.g. mere presence) isn't reused where clickability is required
+        key = (locator, condition)
+        if key not in self._cache:
+            self._cache[key] = self.wait.until(condition(locator))
+        return self._cache[key]
+
+
+class LoginPage(BasePage):
+    """Page Object representing the login page"""
+
+    # Fills and submits the login form in the browser. Dispatching input and
+    # change events keeps framework-bound forms (React, Vue) in sync with the
+    # values set from script.
+    FAST_LOGIN_SCRIPT = """
+        const [emailInput, passwordInput, rememberMeCheckbox, submitButton,
+               email, password] = arguments;
+        const setValue = (element, value) => {
+            element.value = value;
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        };
+        setValue(emailInput, email);
+        setValue(passwordInput, password);
+        if (rememberMeCheckbox && !rememberMeCheckbox.checked) {
+            rememberMeCheckbox.click();
+        }
+        submitButton.click();
+    """
+
+    def __init__(self, driver):
+        super().__init__(driver)
         self.url = "https://example.com/login"
         
         # Define selectors
@@ -27,63 +94,124 @@ class LoginPage:
         self.remember_me_checkbox = (By.ID, "rememberMe")
         self.login_button = (By.CSS_SELECTOR, "button[type='submit']")
         self.error_message = (By.CLASS_NAME, "error-message")
+        self.csrf_token = (By.NAME, "csrf_token")
         self.forgot_password_link = (By.PARTIAL_LINK_TEXT, "Forgot Password")
         
     def navigate(self):
         """Navigate to the login page"""
         self.driver.get(self.url)
+        # The old DOM is gone, so are any elements found on it
+        self._cache.clear()
         return self
         
+    @refresh_stale_elements
     def login(self, email, password, remember_me=False):
         """Enter login credentials and submit the form"""
         # Clear and fill email field
-        email_element = self.driver.find_element(*self.email_input)
-        email_element.clear()
-        email_element.send_keys(email)
+        self.enter_email(email)
         
         # Clear and fill password field
-        password_element = self.driver.find_element(*self.password_input)
+        password_element = self._el(self.password_input)
         password_element.clear()
         password_element.send_keys(password)
         
         # Check Remember Me if requested
         if remember_me:
-            remember_me_element = self.driver.find_element(*self.remember_me_checkbox)
+            remember_me_element = self._el(self.remember_me_checkbox)
             if not remember_me_element.is_selected():
                 remember_me_element.click()
                 
         # Submit the form
-        self.driver.find_element(*self.login_button).click()
+        self.submit()
+        return self
+        
+    @refresh_stale_elements
+    def enter_email(self, email):
+        """Clear the email field and type into it"""
+        email_element = self._el(self.email_input)
+        email_element.clear()
+        email_element.send_keys(email)
+        return self
+        
+    @refresh_stale_elements
+    def submit(self):
+        """Submit the login form"""
+        self._el(self.login_button).click()
+        self._cache.clear()
+        return self
+        
+    @refresh_stale_elements
+    def get_csrf_token_field(self):
+        """Get the hidden CSRF token input of the login form"""
+        return self._el(self.csrf_token, EC.presence_of_element_located)
+        
+    @refresh_stale_elements
+    def is_login_button_enabled(self):
+        """Check whether the login button can be clicked"""
+        return self._el(self.login_button, EC.presence_of_element_located).is_enabled()
+        
+    @refresh_stale_elements
+    def fast_login(self, email, password, remember_me=False):
+        """Fill and submit the login form in a single script call
+
+        The form elements are still located through the page's explicit
+        waits first. Use login() instead when the test depends on real
+        keystrokes, such as client-side validation on key or blur events.
+        """
+        # Waiting on the submit button first means a form that is still being
+        # rendered by JavaScript is ready before anything else is looked up
+        login_button = self._el(self.login_button)
+        remember_me_element = self._el(self.remember_me_checkbox) if remember_me else None
+        self.driver.execute_script(
+            self.FAST_LOGIN_SCRIPT,
+            self._el(self.email_input),
+            self._el(self.password_input),
+            remember_me_element,
+            login_button,
+            email,
+            password,
+        )
+        self._cache.clear()
         return self
         
     def get_error_message(self):
         """Get the error message text if present"""
+        # Errors are rendered in the response to the submit, so a short wait
+        # is enough and keeps tests that expect no error from stalling
         try:
-            error_element = WebDriverWait(self.driver, 5).until(
+            error_element = WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
                 EC.visibility_of_element_located(self.error_message)
             )
             return error_element.text
-        except:
+        except TimeoutException:
             return None
             
+    @refresh_stale_elements
     def click_forgot_password(self):
         """Click the forgot password link"""
-        self.driver.find_element(*self.forgot_password_link).click()
+        self._el(self.forgot_password_link).click()
+        self._cache.clear()
         return self
         
     def is_on_login_page(self):
         """Check if we're on the login page"""
-        return "/login" in self.driver.current_url and \
-               WebDriverWait(self.driver, 5).until(
-                   EC.visibility_of_element_located(self.login_button)
-               )
+        # Wait for the URL and the form together so a navigation that is
+        # still in flight isn't reported as a miss
+        try:
+            self.wait.until(EC.all_of(
+                EC.url_contains("/login"),
+                EC.visibility_of_element_located(self.login_button),
+            ))
+            return True
+        except TimeoutException:
+            return False
 
 
-class DashboardPage:
+class DashboardPage(BasePage):
     """Page Object representing the dashboard page"""
     
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.url = "https://example.com/dashboard"
         
         # Define selectors
@@ -92,55 +220,147 @@ class DashboardPage:
         
     def is_on_dashboard(self):
         """Check if we're on the dashboard page"""
-        return "/dashboard" in self.driver.current_url and \
-               WebDriverWait(self.driver, 5).until(
-                   EC.visibility_of_element_located(self.user_greeting)
-               )
+        try:
+            self.wait.until(EC.all_of(
+                EC.url_contains("/dashboard"),
+                EC.visibility_of_element_located(self.user_greeting),
+            ))
+            return True
+        except TimeoutException:
+            return False
                
+    @refresh_stale_elements
     def get_user_greeting(self):
         """Get the user greeting text"""
-        greeting_element = self.driver.find_element(*self.user_greeting)
+        greeting_element = self._el(self.user_greeting, EC.visibility_of_element_located)
         return greeting_element.text
         
+    @refresh_stale_elements
     def logout(self):
         """Click the logout button"""
-        self.driver.find_element(*self.logout_button).click()
+        self._el(self.logout_button).click()
+        self._cache.clear()
         return self
 
 
-class LoginTest(unittest.TestCase):
-    """Test cases for the login functionality"""
+CHROME_LEAN_ARGUMENTS = [
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--disable-translate',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+]
+
+# Static assets the non-visual tests never look at; blocked via the Chrome
+# DevTools Protocol unless the suite runs with --visual. Stylesheets stay:
+# visibility and clickability checks depend on computed style.
+BLOCKED_ASSET_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif',
+    '*.woff', '*.woff2', '*.ttf',
+]
+
+
+def create_driver(visual=False):
+    """Launch a new Chrome WebDriver configured for this environment
+
+    Unless visual is set, images and fonts are not loaded.
+    """
+    # Define WebDriver options
+    options = webdriver.ChromeOptions()
+    if os.environ.get('CI') == 'true':
+        # Run in headless mode for CI environments
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up the WebDriver once for all tests"""
-        # Define WebDriver options
-        options = webdriver.ChromeOptions()
-        if os.environ.get('CI') == 'true':
-            # Run in headless mode for CI environments
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-        
-        # Initialize WebDriver
-        service = Service('chromedriver')  # Path to chromedriver
-        cls.driver = webdriver.Chrome(service=service, options=options)
-        cls.driver.implicitly_wait(10)
-        
-        # Load test data
-        with open('test_data/users.json', 'r') as f:
-            cls.test_data = json.load(f)
+    # Skip Chrome subsystems the tests never use; this cuts startup time and
+    # memory when several browsers run side by side under pytest-xdist
+    for argument in CHROME_LEAN_ARGUMENTS:
+        options.add_argument(argument)
+    if not visual:
+        # Don't download images; none of these tests check rendering
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
     
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up after all tests"""
-        cls.driver.quit()
-        
-    def setUp(self):
+    # No implicit wait: page objects use explicit waits that return as soon
+    # as the element they need is ready
+    hub_url = os.environ.get('SELENIUM_HUB')
+    if hub_url:
+        # Run the browser on a Selenium Grid node instead of this machine
+        return webdriver.Remote(command_executor=hub_url, options=options)
+    
+    # Initialize WebDriver
+    service = Service('chromedriver')  # Path to chromedriver
+    driver = webdriver.Chrome(service=service, options=options)
+    
+    # DevTools commands need a local ChromeDriver, so Grid sessions only
+    # get the image blocking from the options above
+    if not visual:
+        # Block fonts too, which the flags above can't
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_ASSET_URLS})
+    return driver
+
+
+@pytest.fixture(scope="session")
+def driver(request):
+    """Set up one WebDriver per test session
+
+    Under pytest-xdist every worker runs its own session, so each worker
+    launches Chrome once and reuses it for every test it runs.
+    """
+    driver = create_driver(visual=request.config.getoption("--visual"))
+    yield driver
+    
+    # Clean up after all tests on this worker
+    driver.quit()
+
+
+# Shared user fixtures, resolved from this file so the suite can run from any
+# directory. The tests read users.valid, users.lockoutTarget (an account only
+# the lockout test may lock) and invalidCredentials; a replacement file must
+# provide all three.
+TEST_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'test-data-management', 'fixtures', 'users.json'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_test_data():
+    """Read and parse the test data file once per process"""
+    with open(TEST_DATA_PATH, 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def test_data():
+    """Provide the test data loaded for this process"""
+    return load_test_data()
+
+
+class TestLogin:
+    """Test cases for the login functionality"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, driver, test_data):
         """Set up for each test case"""
+        self.driver = driver
+        self.test_data = test_data
         self.login_page = LoginPage(self.driver)
         self.dashboard_page = DashboardPage(self.driver)
         
+        # The browser is shared by every test on this worker, so drop any
+        # session left behind by the previous test
+        self.driver.delete_all_cookies()
+        
         # Start each test at the login page
         self.login_page.navigate()
         
@@ -150,143 +370,189 @@ class LoginTest(unittest.TestCase):
         valid_user = self.test_data['users']['valid']
         
         # Perform login
-        self.login_page.login(valid_user['email'], valid_user['password'])
+        self.login_page.fast_login(valid_user['email'], valid_user['password'])
         
         # Verify redirect to dashboard
-        self.assertTrue(self.dashboard_page.is_on_dashboard())
+        assert self.dashboard_page.is_on_dashboard(), (
+            "Should be redirected to dashboard after successful login"
+        )
         
-        # Close the browser to clear session cookies
-        self.driver.quit()
+        # Verify user name in greeting
+        greeting = self.dashboard_page.get_user_greeting()
+        assert valid_user['name'] in greeting, (
+            f"Greeting '{greeting}' should contain user name '{valid_user['name']}'"
+        )
         
-        # Re-initialize WebDriver
-        options = webdriver.ChromeOptions()
-        if os.environ.get('CI') == 'true':
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
+    def test_invalid_credentials(self):
+        """Test that invalid credentials are rejected"""
+        # Test each invalid credential scenario
+        for invalid_case in self.test_data['invalidCredentials']:
+            # Reset to login page
+            self.login_page.navigate()
+            
+            # Attempt login with invalid credentials, typing them so that
+            # client-side validation sees real keystrokes
+            self.login_page.login(invalid_case['email'], invalid_case['password'])
+            
+            # Verify error message
+            error_message = self.login_page.get_error_message()
+            assert error_message is not None, (
+                f"Should show error message for scenario: {invalid_case['scenario']}"
+            )
+            assert invalid_case['expectedError'] in error_message, (
+                f"Error message for {invalid_case['scenario']} should contain '{invalid_case['expectedError']}'"
+            )
+            
+            # Verify still on login page
+            assert self.login_page.is_on_login_page(), (
+                f"Should remain on login page for scenario: {invalid_case['scenario']}"
+            )
+            
+    def test_remember_me(self):
+        """Test that Remember Me functionality works"""
+        # Get a valid user from test data
+        valid_user = self.test_data['users']['valid']
         
-        service = Service('chromedriver')
-        self.driver = self.__class__.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.implicitly_wait(10)
+        # Login with Remember Me checked
+        self.login_page.fast_login(valid_user['email'], valid_user['password'], remember_me=True)
         
-        # Initialize page objects again
-        self.login_page = LoginPage(self.driver)
-        self.dashboard_page = DashboardPage(self.driver)
+        # Verify redirect to dashboard
+        assert self.dashboard_page.is_on_dashboard()
+        
+        # Simulate closing the browser: session cookies are dropped, while
+        # persistent cookies (those with an expiry, as Remember Me writes)
+        # survive a restart
+        persistent_cookies = [
+            cookie for cookie in self.driver.get_cookies() if 'expiry' in cookie
+        ]
+        self.driver.delete_all_cookies()
+        for cookie in persistent_cookies:
+            self.driver.add_cookie(cookie)
         
         # Navigate directly to dashboard
         self.driver.get("https://example.com/dashboard")
         
         # If Remember Me works, we should still be on dashboard
         # Otherwise, we should be redirected to login
-        try:
-            self.assertTrue(
-                self.dashboard_page.is_on_dashboard(),
-                "Should remain logged in with Remember Me enabled"
-            )
-        except:
-            self.fail("Remember Me functionality failed - user was logged out")
+        assert self.dashboard_page.is_on_dashboard(), (
+            "Remember Me functionality failed - user was logged out"
+        )
             
     def test_forgot_password(self):
         """Test that Forgot Password link works"""
         # Click the Forgot Password link
         self.login_page.click_forgot_password()
         
-        # Verify redirect to password reset page
-        self.assertIn(
-            "/forgot-password",
-            self.driver.current_url,
-            "Should be redirected to forgot password page"
-        )
+        # Verify redirect to password reset page, waiting for the navigation
+        # rather than reading the URL before it has changed
+        try:
+            WebDriverWait(self.driver, 5, poll_frequency=0.25).until(
+                EC.url_contains("/forgot-password")
+            )
+            redirected = True
+        except TimeoutException:
+            redirected = False
+        assert redirected, "Should be redirected to forgot password page"
         
         # Verify the reset form is displayed
-        reset_form = WebDriverWait(self.driver, 5).until(
+        reset_form = WebDriverWait(self.driver, 5, poll_frequency=0.25).until(
             EC.visibility_of_element_located((By.ID, "reset-form"))
         )
-        self.assertTrue(reset_form.is_displayed(), "Password reset form should be visible")
+        assert reset_form.is_displayed(), "Password reset form should be visible"
         
     def test_logout(self):
         """Test that a user can log out successfully"""
         # First, log in with valid credentials
         valid_user = self.test_data['users']['valid']
-        self.login_page.login(valid_user['email'], valid_user['password'])
+        self.login_page.fast_login(valid_user['email'], valid_user['password'])
         
         # Verify redirect to dashboard
-        self.assertTrue(self.dashboard_page.is_on_dashboard())
+        assert self.dashboard_page.is_on_dashboard()
         
         # Log out
         self.dashboard_page.logout()
         
         # Verify redirect to login page
-        self.assertTrue(
-            self.login_page.is_on_login_page(),
+        assert self.login_page.is_on_login_page(), (
             "Should be redirected to login page after logout"
         )
         
         # Verify cannot access dashboard after logout
         self.driver.get("https://example.com/dashboard")
-        self.assertTrue(
-            self.login_page.is_on_login_page(),
+        assert self.login_page.is_on_login_page(), (
             "Should not be able to access dashboard after logout"
         )
         
     def test_login_attempts_lockout(self):
         """Test that account gets locked after multiple failed login attempts"""
-        # Get test data
-        user_email = self.test_data['users']['valid']['email']
+        # Use an account reserved for this test: locking the shared valid user
+        # would break tests logging in with it on other xdist workers
+        user_email = self.test_data['users']['lockoutTarget']['email']
         wrong_password = "WrongPassword123!"
         max_attempts = 5  # Assuming 5 is the lockout threshold
         
-        # Attempt login with wrong password multiple times
-        for i in range(max_attempts):
-            self.login_page.navigate()
-            self.login_page.login(user_email, wrong_password)
-            
-            # Verify error message
-            error_message = self.login_page.get_error_message()
-            self.assertIsNotNone(error_message, f"Should show error message for attempt {i+1}")
+        # Only the final attempt's UI matters, so send the earlier ones straight
+        # to the login endpoint using this browser's cookies and CSRF token
+        session = requests.Session()
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        session.headers.update({"Referer": self.login_page.url})
+        csrf_token = self.login_page.get_csrf_token_field().get_attribute("value")
+        error_class = self.login_page.error_message[1]
+        for attempt in range(1, max_attempts):
+            response = session.post(self.login_page.url, data={
+                "email": user_email,
+                "password": wrong_password,
+                "csrf_token": csrf_token,
+            }, timeout=10)
             
-            # If this is the last attempt before lockout, the error message might change
-            if i == max_attempts - 1:
-                self.assertIn(
-                    "locked",
-                    error_message.lower(),
-                    "Should indicate account is locked after multiple failed attempts"
+            # Stop here if the API attempt wasn't counted as a failed login;
+            # otherwise the lockout assertions below fail for the wrong reason.
+            # Rejected passwords may legitimately come back as 401 or 422, so
+            # only a forbidden request or a server error counts as rejected.
+            rejected = response.status_code == 403 or response.status_code >= 500
+            if rejected or "/login" not in response.url or error_class not in response.text:
+                pytest.fail(
+                    f"API login attempt {attempt} did not return a failed-login page "
+                    f"(status {response.status_code}, ended at {response.url}); "
+                    f"check the endpoint and CSRF handling"
                 )
-                
+            
+        # The last attempt before lockout goes through the UI
+        self.login_page.navigate()
+        self.login_page.fast_login(user_email, wrong_password)
+        
+        # Verify the error message indicates the account is now locked
+        error_message = self.login_page.get_error_message()
+        assert error_message is not None, (
+            f"Should show error message for attempt {max_attempts}"
+        )
+        assert "locked" in error_message.lower(), (
+            "Should indicate account is locked after multiple failed attempts"
+        )
+        
         # Try one more time to verify account is locked
         self.login_page.navigate()
-        self.login_page.login(user_email, wrong_password)
+        self.login_page.fast_login(user_email, wrong_password)
         
         # Verify lockout message
         error_message = self.login_page.get_error_message()
-        self.assertIn(
-            "locked",
-            error_message.lower(),
-            "Should show account locked message"
-        )
+        assert "locked" in error_message.lower(), "Should show account locked message"
         
         # Verify the login button is disabled or another lockout indicator
-        login_button = self.driver.find_element(*self.login_page.login_button)
-        self.assertFalse(
-            login_button.is_enabled(),
+        assert not self.login_page.is_login_button_enabled(), (
             "Login button should be disabled when account is locked"
         )
         
     def test_csrf_protection(self):
         """Test that CSRF token is included and validated"""
-        # Navigate to login page
-        self.login_page.navigate()
-        
         # Verify CSRF token exists in the form
-        csrf_token = self.driver.find_element(By.NAME, "csrf_token")
-        self.assertIsNotNone(csrf_token, "CSRF token should exist in the form")
+        csrf_token = self.login_page.get_csrf_token_field()
+        assert csrf_token is not None, "CSRF token should exist in the form"
         
         # Get the original token value
         original_token_value = csrf_token.get_attribute("value")
-        self.assertIsNotNone(
-            original_token_value,
-            "CSRF token should have a value"
-        )
+        assert original_token_value is not None, "CSRF token should have a value"
         
         # Modify the token using JavaScript to simulate a CSRF attack
         self.driver.execute_script(
@@ -296,20 +562,17 @@ class LoginTest(unittest.TestCase):
         
         # Attempt to login with valid credentials but invalid CSRF token
         valid_user = self.test_data['users']['valid']
-        self.login_page.login(valid_user['email'], valid_user['password'])
+        self.login_page.fast_login(valid_user['email'], valid_user['password'])
         
         # Check if the login was prevented
         # This could be indicated by an error message or by staying on the login page
         error_message = self.login_page.get_error_message()
         if error_message:
-            self.assertIn(
-                "security",
-                error_message.lower(),
+            assert "security" in error_message.lower(), (
                 "Should show security-related error for invalid CSRF token"
             )
         else:
-            self.assertTrue(
-                self.login_page.is_on_login_page(),
+            assert self.login_page.is_on_login_page(), (
                 "Should remain on login page when CSRF token is invalid"
             )
         
@@ -319,84 +582,29 @@ class LoginTest(unittest.TestCase):
         xss_payload = '<script>alert("XSS")</script>'
         
         # Enter the XSS payload into the email field
-        self.login_page.navigate()
-        email_element = self.driver.find_element(*self.login_page.email_input)
-        email_element.clear()
-        email_element.send_keys(xss_payload)
+        self.login_page.enter_email(xss_payload)
         
         # Submit the form
-        self.driver.find_element(*self.login_page.login_button).click()
+        self.login_page.submit()
         
         # Check if the XSS payload was executed by looking for alerts
         try:
             # If an alert is present, the XSS attack was successful
-            WebDriverWait(self.driver, 3).until(EC.alert_is_present())
-            self.fail("XSS attack was successful - alert was triggered")
-        except:
+            WebDriverWait(self.driver, 3, poll_frequency=0.25).until(EC.alert_is_present())
+        except TimeoutException:
             # No alert means the XSS was properly sanitized
             pass
+        else:
+            pytest.fail("XSS attack was successful - alert was triggered")
         
         # Verify the payload is properly escaped in any error messages
         error_message = self.login_page.get_error_message()
         if error_message and xss_payload in error_message:
             # Check if the script tag is displayed as text rather than executed
-            self.assertIn(
-                "&lt;script&gt;",
-                self.driver.page_source,
+            assert "&lt;script&gt;" in self.driver.page_source, (
                 "XSS payload should be escaped in the page"
             )
 
 
 if __name__ == "__main__":
-    unittest.main()
- dashboard
-        self.assertTrue(
-            self.dashboard_page.is_on_dashboard(),
-            "Should be redirected to dashboard after successful login"
-        )
-        
-        # Verify user name in greeting
-        greeting = self.dashboard_page.get_user_greeting()
-        self.assertIn(
-            valid_user['name'],
-            greeting,
-            f"Greeting '{greeting}' should contain user name '{valid_user['name']}'"
-        )
-        
-    def test_invalid_credentials(self):
-        """Test that invalid credentials are rejected"""
-        # Test each invalid credential scenario
-        for invalid_case in self.test_data['invalidCredentials']:
-            # Reset to login page
-            self.login_page.navigate()
-            
-            # Attempt login with invalid credentials
-            self.login_page.login(invalid_case['email'], invalid_case['password'])
-            
-            # Verify error message
-            error_message = self.login_page.get_error_message()
-            self.assertIsNotNone(
-                error_message,
-                f"Should show error message for scenario: {invalid_case['scenario']}"
-            )
-            self.assertIn(
-                invalid_case['expectedError'],
-                error_message,
-                f"Error message for {invalid_case['scenario']} should contain '{invalid_case['expectedError']}'"
-            )
-            
-            # Verify still on login page
-            self.assertTrue(
-                self.login_page.is_on_login_page(),
-                f"Should remain on login page for scenario: {invalid_case['scenario']}"
-            )
-            
-    def test_remember_me(self):
-        """Test that Remember Me functionality works"""
-        # Get a valid user from test data
-        valid_user = self.test_data['users']['valid']
-        
-        # Login with Remember Me checked
-        self.login_page.login(valid_user['email'], valid_user['password'], remember_me=True)
-        
-        # Verify redirect to
\ No newline at end of file
+    pytest.main([__file__])
@@ -3,8 +3,12 @@ User Service Unit Tests using pytest
 
 This file demonstrates how to structure and write effective PyTest unit tests
 for a user service module.
+
+pytest.ini runs the suite under pytest-xdist with -n auto --dist=loadscope,
+which sends every test of a class to the same worker.
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Import the service to test
@@ -14,28 +18,28 @@ from app.exceptions import AuthenticationError, UserExistsError, ValidationError
 
 
 # Fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_repo_mock():
     """Create a mock user repository"""
     mock = MagicMock()
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def email_service_mock():
     """Create a mock email service"""
     mock = MagicMock()
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def token_service_mock():
     """Create a mock token service"""
     mock = MagicMock()
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_service(user_repo_mock, email_service_mock, token_service_mock):
     """Create a UserService instance with mocked dependencies"""
     return UserService(
@@ -45,6 +49,29 @@ def user_service(user_repo_mock, email_service_mock, token_service_mock):
     )
 
 
+@pytest.fixture
+def make_stub_user_service():
+    """Create UserService instances backed by lightweight stubs
+
+    For tests that only need canned return values; use the MagicMock
+    fixtures when a test asserts on calls.
+    """
+    def make(user_repository=None, email_service=None, token_service=None):
+        return UserService(
+            user_repository=user_repository or SimpleNamespace(),
+            email_service=email_service or SimpleNamespace(),
+            token_service=token_service or SimpleNamespace(),
+        )
+    return make
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(user_repo_mock, email_service_mock, token_service_mock):
+    """Reset the shared mocks so each test starts with clean call history"""
+    for mock in (user_repo_mock, email_service_mock, token_service_mock):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def valid_user():
     """Create a valid user object for testing"""
@@ -90,12 +117,18 @@ class TestUserAuthentication:
         assert "Invalid credentials" in str(excinfo.value)
         user_repo_mock.find_by_credentials.assert_called_once_with(email, password)
 
-    def test_authenticate_handles_repository_errors(self, user_service, user_repo_mock):
+    def test_authenticate_handles_repository_errors(self, make_stub_user_service):
         """Should handle repository errors gracefully"""
         # Arrange
         email = "user@example.com"
         password = "password"
-        user_repo_mock.find_by_credentials.side_effect = Exception("Database error")
+
+        def find_by_credentials(email, password):
+            raise Exception("Database error")
+
+        user_service = make_stub_user_service(
+            user_repository=SimpleNamespace(find_by_credentials=find_by_credentials)
+        )
 
         # Act/Assert
         with pytest.raises(AuthenticationError) as excinfo:
@@ -110,8 +143,11 @@ class TestUserAuthentication:
         (None, "password"),  # None email
         ("user@example.com", None),  # None password
     ])
-    def test_authenticate_with_missing_credentials(self, user_service, email, password):
+    def test_authenticate_with_missing_credentials(self, make_stub_user_service, email, password):
         """Should validate that credentials are provided"""
+        # Arrange
+        user_service = make_stub_user_service()
+
         # Act/Assert
         with pytest.raises(ValidationError) as excinfo:
             user_service.authenticate(email, password)
@@ -269,13 +305,15 @@ class TestPasswordReset:
         assert "Invalid or expired reset token" in str(excinfo.value)
         user_repo_mock.update_password.assert_not_called()
 
-    def test_complete_password_reset_with_weak_password(self, user_service, token_service_mock):
+    def test_complete_password_reset_with_weak_password(self, make_stub_user_service):
         """Should validate password strength during reset"""
         # Arrange
         token = "valid-token"
         weak_password = "123"  # Too short
         user_id = "user-123"
-        token_service_mock.verify_reset_token.return_value = user_id
+        user_service = make_stub_user_service(
+            token_service=SimpleNamespace(verify_reset_token=lambda token: user_id)
+        )
 
         # Act/Assert
         with pytest.raises(ValidationError) as excinfo: